@@ -20,24 +20,52 @@ so that it can handle minor variations across server versions. Refer to the
 from __future__ import annotations
 
 import argparse
-import json
+import functools
+import hashlib
+import io
 import logging
 import re
 import subprocess
+import sys
+import threading
 import time
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Union
 
 from prometheus_client import Gauge, start_http_server
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import REGISTRY, Collector, CollectorRegistry
+
+try:  # orjson is an optional, faster drop-in for the stdlib decoder.
+    import orjson as _json
+
+    _JSON_ACCEPTS_BUFFERS = True
+except ImportError:  # pragma: no cover - depends on the environment
+    import json as _json  # type: ignore[no-redef]
+
+    # The stdlib decoder only takes str, bytes and bytearray.
+    _JSON_ACCEPTS_BUFFERS = False
+
+try:  # ijson enables incremental parsing of very large JSON payloads.
+    import ijson
+except ImportError:  # pragma: no cover - depends on the environment
+    ijson = None
 
 _LOGGER = logging.getLogger(__name__)
 
+# Starting size of the reusable buffer for the status command output.
+_INITIAL_BUFFER_SIZE = 64 * 1024
 
-@dataclass
-class FeatureStatus:
-    """Represents the utilization of a single licensed feature."""
+
+class FeatureStatus(NamedTuple):
+    """Represents the utilization of a single licensed feature.
+
+    Parsed statuses keep per-feature values in columns on
+    :class:`ServerStatus`; this class is only a convenience view of one row.
+    """
 
     total: float
     in_use: float
@@ -47,64 +75,190 @@ class FeatureStatus:
 
 @dataclass
 class ServerStatus:
-    """Aggregated status for the server-wide metrics."""
+    """Aggregated status for the server-wide metrics.
+
+    Per-feature values are stored as parallel columns: ``feature_names[i]``
+    describes the row whose values live at index ``i`` of the
+    ``feature_totals``, ``feature_in_use``, ``feature_borrowed`` and
+    ``feature_denials`` arrays.
+    """
 
     total: Optional[float] = None
     in_use: Optional[float] = None
     available: Optional[float] = None
     denials: Optional[float] = None
     heartbeat_ts: Optional[float] = None
-    features: Dict[str, FeatureStatus] = None  # type: ignore[assignment]
+    feature_names: List[str] = field(default_factory=list)
+    feature_totals: array = field(default_factory=lambda: array("d"))
+    feature_in_use: array = field(default_factory=lambda: array("d"))
+    feature_borrowed: array = field(default_factory=lambda: array("d"))
+    feature_denials: array = field(default_factory=lambda: array("d"))
+    _feature_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+
+    def add_feature(
+        self, name: str, total: float, in_use: float, borrowed: float, denials: float
+    ) -> None:
+        """Append a feature row, replacing the values of a repeated name."""
+        index = self._feature_index.get(name)
+        if index is None:
+            # Interned so that repeated polls share one string per feature.
+            name = sys.intern(name)
+            self._feature_index[name] = len(self.feature_names)
+            self.feature_names.append(name)
+            self.feature_totals.append(total)
+            self.feature_in_use.append(in_use)
+            self.feature_borrowed.append(borrowed)
+            self.feature_denials.append(denials)
+        else:
+            self.feature_totals[index] = total
+            self.feature_in_use[index] = in_use
+            self.feature_borrowed[index] = borrowed
+            self.feature_denials[index] = denials
 
-    def __post_init__(self) -> None:
-        if self.features is None:
-            self.features = {}
+    def add_features(
+        self,
+        names: List[str],
+        totals: array,
+        in_use: array,
+        borrowed: array,
+        denials: array,
+    ) -> None:
+        """Append a block of feature rows given as columns.
+
+        The columns are appended in bulk unless a name repeats, in which case
+        the rows are added one at a time through :meth:`add_feature`.
+        """
+        start = len(self.feature_names)
+        block_index = dict(zip(names, range(start, start + len(names))))
+        if len(block_index) != len(names) or not block_index.keys().isdisjoint(self._feature_index):
+            for row in zip(names, totals, in_use, borrowed, denials):
+                self.add_feature(*row)
+            return
+        self.feature_names.extend(map(sys.intern, names))
+        self.feature_totals.extend(totals)
+        self.feature_in_use.extend(in_use)
+        self.feature_borrowed.extend(borrowed)
+        self.feature_denials.extend(denials)
+        self._feature_index.update(zip(self.feature_names[start:], range(start, start + len(names))))
+
+    @property
+    def features(self) -> Dict[str, FeatureStatus]:
+        """Per-feature view of the columns, keyed by feature name."""
+        return {
+            name: FeatureStatus(total, in_use, borrowed, denials)
+            for name, total, in_use, borrowed, denials in zip(
+                self.feature_names,
+                self.feature_totals,
+                self.feature_in_use,
+                self.feature_borrowed,
+                self.feature_denials,
+            )
+        }
 
 
-class OLicenseExporter:
-    """Main exporter loop that polls the server status command."""
+class StatusCollector(Collector):
+    """Exposes the metrics of the most recently published server status.
 
-    FEATURE_TOTAL = Gauge(
-        "olicense_feature_total_licenses",
-        "Configured license capacity for each feature.",
-        ["feature"],
-    )
-    FEATURE_IN_USE = Gauge(
-        "olicense_feature_licenses_in_use",
-        "Currently consumed licenses per feature.",
-        ["feature"],
-    )
-    FEATURE_BORROWED = Gauge(
-        "olicense_feature_licenses_borrowed",
-        "Number of borrowed/offline licenses per feature.",
-        ["feature"],
-    )
-    FEATURE_DENIALS = Gauge(
-        "olicense_feature_denials_total",
-        "Total denials recorded per feature in the status output.",
-        ["feature"],
-    )
+    Samples are generated from a single :class:`ServerStatus` snapshot when
+    Prometheus scrapes ``/metrics``, so a scrape never observes a status that
+    is only partially applied. The polling thread swaps in a new snapshot with
+    :meth:`publish`. Features missing from the latest status are simply not
+    reported.
+    """
 
-    SERVER_TOTAL = Gauge(
-        "olicense_server_total_licenses",
-        "Total license seats configured on the server.",
-    )
-    SERVER_IN_USE = Gauge(
-        "olicense_server_licenses_in_use",
-        "Total license seats currently consumed on the server.",
-    )
-    SERVER_AVAILABLE = Gauge(
-        "olicense_server_licenses_available",
-        "Number of license seats reported as available.",
-    )
-    SERVER_DENIALS = Gauge(
-        "olicense_server_denials_total",
-        "Total denials reported by the server status output.",
+    _SERVER_FAMILIES = (
+        (
+            "olicense_server_total_licenses",
+            "Total license seats configured on the server.",
+            "total",
+        ),
+        (
+            "olicense_server_licenses_in_use",
+            "Total license seats currently consumed on the server.",
+            "in_use",
+        ),
+        (
+            "olicense_server_licenses_available",
+            "Number of license seats reported as available.",
+            "available",
+        ),
+        (
+            "olicense_server_denials_total",
+            "Total denials reported by the server status output.",
+            "denials",
+        ),
+        (
+            "olicense_server_heartbeat_timestamp",
+            "Heartbeat timestamp reported by the server (seconds since epoch).",
+            "heartbeat_ts",
+        ),
     )
-    SERVER_HEARTBEAT = Gauge(
-        "olicense_server_heartbeat_timestamp",
-        "Heartbeat timestamp reported by the server (seconds since epoch).",
+    _FEATURE_FAMILIES = (
+        (
+            "olicense_feature_total_licenses",
+            "Configured license capacity for each feature.",
+            "feature_totals",
+        ),
+        (
+            "olicense_feature_licenses_in_use",
+            "Currently consumed licenses per feature.",
+            "feature_in_use",
+        ),
+        (
+            "olicense_feature_licenses_borrowed",
+            "Number of borrowed/offline licenses per feature.",
+            "feature_borrowed",
+        ),
+        (
+            "olicense_feature_denials_total",
+            "Total denials recorded per feature in the status output.",
+            "feature_denials",
+        ),
     )
+
+    def __init__(self, registry: Optional[CollectorRegistry] = REGISTRY) -> None:
+        self._lock = threading.Lock()
+        self._published: Optional[ServerStatus] = None
+        if registry is not None:
+            registry.register(self)
+
+    def publish(self, status: ServerStatus) -> None:
+        """Replace the snapshot served on subsequent scrapes.
+
+        Server-wide values that are missing from ``status`` keep the value
+        from the previous snapshot.
+        """
+        with self._lock:
+            previous = self._published
+            if previous is not None:
+                for _, _, attr in self._SERVER_FAMILIES:
+                    if getattr(status, attr) is None:
+                        setattr(status, attr, getattr(previous, attr))
+            self._published = status
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        with self._lock:
+            snapshot = self._published
+        for name, documentation, column in self._FEATURE_FAMILIES:
+            family = GaugeMetricFamily(name, documentation, labels=["feature"])
+            if snapshot is not None:
+                add_metric = family.add_metric
+                for feature_name, value in zip(snapshot.feature_names, getattr(snapshot, column)):
+                    add_metric([feature_name], value)
+            yield family
+        for name, documentation, attr in self._SERVER_FAMILIES:
+            family = GaugeMetricFamily(name, documentation)
+            value = getattr(snapshot, attr) if snapshot is not None else None
+            if value is not None:
+                family.add_metric([], value)
+            yield family
+
+
+class OLicenseExporter:
+    """Main exporter loop that polls the server status command."""
+
+    STATUS = StatusCollector()
+
     SCRAPE_SUCCESS = Gauge(
         "olicense_exporter_scrape_success",
         "1 if the last scrape succeeded, 0 otherwise.",
@@ -125,75 +279,123 @@ class OLicenseExporter:
         self._status_command = list(status_command) if status_command else None
         self._status_file = status_file
         self._poll_interval = poll_interval
-        self._active_features: set[str] = set()
+        # The output format of a server does not change between polls, so it
+        # is detected once and the matching parser is pinned afterwards.
+        self._parse: Callable[[Union[bytes, memoryview]], ServerStatus] = self._detect_and_parse
+        # Digest of the last successfully recorded output; identical output is
+        # not parsed again.
+        self._last_digest = b""
+        # Command output is read into this buffer, which is reused by every
+        # poll instead of allocating a new bytes object per run.
+        self._buffer = bytearray(_INITIAL_BUFFER_SIZE)
+
+    def start(self) -> threading.Thread:
+        """Run the polling loop in a daemon thread and return that thread."""
+        thread = threading.Thread(target=self.run, name="olicense-poller", daemon=True)
+        thread.start()
+        return thread
 
     def run(self) -> None:
         """Start the polling loop."""
         _LOGGER.info("Starting exporter; polling every %.1f seconds", self._poll_interval)
+        next_poll = time.monotonic()
         while True:
-            start_time = time.time()
+            start_time = time.monotonic()
             try:
-                raw_output = self._read_status()
-                status = parse_status(raw_output)
-                self._record_metrics(status)
+                # The view is released before the next poll may grow the buffer.
+                with memoryview(self._read_status()) as raw_output:
+                    digest = hashlib.blake2b(raw_output, digest_size=16).digest()
+                    if digest == self._last_digest:
+                        _LOGGER.debug("Status output unchanged; keeping previous metrics")
+                    else:
+                        status = self._parse(raw_output)
+                        self._record_metrics(status)
+                        self._last_digest = digest
                 self.SCRAPE_SUCCESS.set(1)
             except Exception:  # pragma: no cover - we still want to surface this
                 _LOGGER.exception("Failed to collect OLicense status")
                 self.SCRAPE_SUCCESS.set(0)
+                self._parse = self._detect_and_parse
+                self._last_digest = b""
             finally:
-                duration = time.time() - start_time
+                duration = time.monotonic() - start_time
                 self.SCRAPE_DURATION.set(duration)
-            time.sleep(self._poll_interval)
-
-    def _read_status(self) -> str:
+            # Polls follow a fixed monotonic cadence, so the scrape duration
+            # does not accumulate as drift. Ticks missed by an overrunning
+            # poll are skipped rather than run back to back.
+            next_poll += self._poll_interval
+            now = time.monotonic()
+            if now >= next_poll and self._poll_interval > 0:
+                missed = (now - next_poll) // self._poll_interval + 1
+                next_poll += missed * self._poll_interval
+            time.sleep(max(0.0, next_poll - now))
+
+    def _read_status(self) -> Union[bytes, memoryview]:
         """Fetch the status output from either a file or an external command."""
         if self._status_file:
             _LOGGER.debug("Reading status from %s", self._status_file)
-            return self._status_file.read_text(encoding="utf-8")
+            return self._status_file.read_bytes()
         assert self._status_command is not None
         _LOGGER.debug("Executing status command: %s", " ".join(self._status_command))
-        completed = subprocess.run(
+        # Descriptors opened by Python are non-inheritable (PEP 446), so
+        # close_fds is not needed. Leaving it off lets CPython spawn the
+        # command with posix_spawn() instead of fork()/exec() on every poll.
+        with subprocess.Popen(
             self._status_command,
-            capture_output=True,
-            check=True,
-            text=True,
-        )
-        _LOGGER.debug("Status command completed with %s bytes", len(completed.stdout))
-        return completed.stdout
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
+            bufsize=-1,
+        ) as process:
+            assert process.stdout is not None
+            size = self._read_into_buffer(process.stdout)
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, self._status_command)
+        _LOGGER.debug("Status command completed with %s bytes", size)
+        return memoryview(self._buffer)[:size]
+
+    def _read_into_buffer(self, stream: BinaryIO) -> int:
+        """Read ``stream`` to EOF into the reusable output buffer.
+
+        The buffer is never trimmed, so it keeps its allocation across polls.
+        It only grows, doubling in place, when an output fills it completely.
+        Returns the number of bytes read.
+        """
+        buffer = self._buffer
+        size = 0
+        while True:
+            if size == len(buffer):
+                buffer += bytes(len(buffer))
+            with memoryview(buffer) as view, view[size:] as free:
+                count = stream.readinto(free)
+            if not count:
+                break
+            size += count
+        return size
+
+    def _detect_and_parse(self, raw: Union[bytes, memoryview]) -> ServerStatus:
+        """Parse ``raw`` like :func:`parse_status` and pin the detected format."""
+        raw = _check_status_output(raw)
+        status = _parse_json_status(raw)
+        if status is not None:
+            _LOGGER.info("Detected JSON status output")
+            self._parse = _parse_json_status_strict
+            return status
+        # Text that looks like JSON (e.g. a "[OLicense Server Status]" header)
+        # would be rejected by the pinned text parser, so keep detecting.
+        if not _JSON_START_RE.match(raw):
+            _LOGGER.info("Detected plain text status output")
+            self._parse = _parse_text_status_strict
+        return _parse_text_status(raw)
 
     def _record_metrics(self, status: ServerStatus) -> None:
-        """Update Prometheus gauges using the parsed status."""
+        """Publish the parsed status for subsequent Prometheus scrapes."""
         _LOGGER.debug("Recording metrics: %s", status)
-        if status.total is not None:
-            self.SERVER_TOTAL.set(status.total)
-        if status.in_use is not None:
-            self.SERVER_IN_USE.set(status.in_use)
-        if status.available is not None:
-            self.SERVER_AVAILABLE.set(status.available)
-        if status.denials is not None:
-            self.SERVER_DENIALS.set(status.denials)
-        if status.heartbeat_ts is not None:
-            self.SERVER_HEARTBEAT.set(status.heartbeat_ts)
-
-        seen_features = set()
-        for feature_name, feature in status.features.items():
-            seen_features.add(feature_name)
-            self.FEATURE_TOTAL.labels(feature=feature_name).set(feature.total)
-            self.FEATURE_IN_USE.labels(feature=feature_name).set(feature.in_use)
-            self.FEATURE_BORROWED.labels(feature=feature_name).set(feature.borrowed)
-            self.FEATURE_DENIALS.labels(feature=feature_name).set(feature.denials)
-
-        stale_features = self._active_features - seen_features
-        for feature_name in stale_features:
-            _LOGGER.debug("Removing stale feature metrics for %s", feature_name)
-            self.FEATURE_TOTAL.remove(feature_name)
-            self.FEATURE_IN_USE.remove(feature_name)
-            self.FEATURE_BORROWED.remove(feature_name)
-            self.FEATURE_DENIALS.remove(feature_name)
-        self._active_features = seen_features
-
-
-def parse_status(raw: str) -> ServerStatus:
+        self.STATUS.publish(status)
+
+
+def parse_status(raw: Union[bytes, str]) -> ServerStatus:
     """Parse status output from the OLicense server.
 
     The parser supports two primary formats:
@@ -209,7 +411,8 @@ def parse_status(raw: str) -> ServerStatus:
     Parameters
     ----------
     raw:
-        The raw string returned by the status command or read from a file.
+        The raw bytes returned by the status command or read from a file.
+        Strings are accepted as well and are encoded as UTF-8.
 
     Returns
     -------
@@ -217,10 +420,7 @@ def parse_status(raw: str) -> ServerStatus:
         The structured representation of the server metrics.
     """
 
-    raw = raw.strip()
-    if not raw:
-        raise ValueError("Status output was empty")
-
+    raw = _check_status_output(raw)
     json_status = _parse_json_status(raw)
     if json_status is not None:
         return json_status
@@ -228,6 +428,34 @@ def parse_status(raw: str) -> ServerStatus:
     return _parse_text_status(raw)
 
 
+def _check_status_output(raw: Union[bytes, memoryview, str]) -> Union[bytes, memoryview]:
+    if isinstance(raw, str):
+        raw = raw.encode("utf-8")
+    if _BLANK_RE.fullmatch(raw):
+        raise ValueError("Status output was empty")
+    return raw
+
+
+_BLANK_RE = re.compile(rb"\s*")
+
+
+def _parse_json_status_strict(raw: Union[bytes, memoryview]) -> ServerStatus:
+    status = _parse_json_status(_check_status_output(raw))
+    if status is None:
+        raise ValueError("Status output is no longer valid JSON")
+    return status
+
+
+def _parse_text_status_strict(raw: Union[bytes, memoryview]) -> ServerStatus:
+    raw = _check_status_output(raw)
+    if _JSON_START_RE.match(raw):
+        raise ValueError("Status output is no longer plain text")
+    return _parse_text_status(raw)
+
+
+_JSON_START_RE = re.compile(rb"\s*[{\[]")
+
+
 _JSON_FIELD_MAP = {
     "total_licenses": "total",
     "total": "total",
@@ -241,10 +469,19 @@ _JSON_FIELD_MAP = {
 }
 
 
-def _parse_json_status(raw: str) -> Optional[ServerStatus]:
+# Payloads above this size are decoded incrementally when ijson is available
+# so that the ``features`` array is never materialized as a whole.
+_JSON_STREAM_THRESHOLD = 256 * 1024
+_JSON_CONTAINER_START = frozenset({"start_map", "start_array"})
+
+
+def _parse_json_status(raw: Union[bytes, memoryview]) -> Optional[ServerStatus]:
+    if ijson is not None and len(raw) > _JSON_STREAM_THRESHOLD and raw[:1] == b"{":
+        return _parse_json_stream(raw)
+
     try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError:
+        payload = _json.loads(raw if _JSON_ACCEPTS_BUFFERS else bytes(raw))
+    except _json.JSONDecodeError:
         return None
 
     if not isinstance(payload, dict):
@@ -252,107 +489,248 @@ def _parse_json_status(raw: str) -> Optional[ServerStatus]:
 
     status = ServerStatus()
     for key, value in payload.items():
-        normalized = _JSON_FIELD_MAP.get(key.lower())
-        if normalized is None:
-            continue
-        if normalized == "heartbeat_ts":
-            status.heartbeat_ts = _coerce_timestamp(value)
-        else:
-            setattr(status, normalized, _coerce_float(value, field=key))
+        _apply_json_field(status, key, value)
 
     features = payload.get("features")
     if isinstance(features, list):
         for feature_obj in features:
-            if not isinstance(feature_obj, dict):
-                continue
-            name = str(feature_obj.get("name") or feature_obj.get("feature"))
-            if not name or name == "None":
-                continue
-            feature_status = FeatureStatus(
-                total=_coerce_float(feature_obj.get("total"), field="feature.total", default=0.0),
-                in_use=_coerce_float(feature_obj.get("in_use"), field="feature.in_use", default=0.0),
-                borrowed=_coerce_float(feature_obj.get("borrowed"), field="feature.borrowed", default=0.0),
-                denials=_coerce_float(feature_obj.get("denials"), field="feature.denials", default=0.0),
-            )
-            status.features[name] = feature_status
+            _add_json_feature(status, feature_obj)
     return status
 
 
-_KEY_VALUE_RE = re.compile(r"^(?P<key>[\w\s/-]+?)\s*[:=]\s*(?P<value>.+)$")
-_FEATURE_TABLE_RE = re.compile(
-    r"^(?P<name>[\w.-]+)\s+(?P<total>\d+)\s+(?P<in_use>\d+)\s+(?P<borrowed>\d+)\s+(?P<denials>\d+)",
-    re.IGNORECASE,
+def _parse_json_stream(raw: bytes) -> Optional[ServerStatus]:
+    """Decode a JSON status object one top-level value or feature at a time."""
+    status = ServerStatus()
+    key: Optional[str] = None
+    in_features = False
+    builder = None
+    builder_prefix = ""
+    try:
+        for prefix, event, value in ijson.parse(io.BytesIO(raw), use_float=True):
+            if builder is not None:
+                builder.event(event, value)
+                if prefix != builder_prefix or event in _JSON_CONTAINER_START:
+                    continue
+                if event == "map_key":
+                    continue
+                if in_features:
+                    _add_json_feature(status, builder.value)
+                else:
+                    _apply_json_field(status, key, builder.value)
+                builder = None
+            elif in_features:
+                if prefix == "features" and event == "end_array":
+                    in_features = False
+                else:
+                    builder = ijson.ObjectBuilder()
+                    builder_prefix = prefix
+                    builder.event(event, value)
+                    if event not in _JSON_CONTAINER_START:
+                        _add_json_feature(status, builder.value)
+                        builder = None
+            elif prefix == "":
+                if event == "map_key":
+                    key = value
+            elif key == "features" and event == "start_array":
+                in_features = True
+            else:
+                builder = ijson.ObjectBuilder()
+                builder_prefix = prefix
+                builder.event(event, value)
+                if event not in _JSON_CONTAINER_START:
+                    _apply_json_field(status, key, builder.value)
+                    builder = None
+    except ijson.JSONError:
+        return None
+    return status
+
+
+def _apply_json_field(status: ServerStatus, key: str, value: object) -> None:
+    # The map keys are lowercase already; only lowercase the key on a miss.
+    normalized = _JSON_FIELD_MAP.get(key) or _JSON_FIELD_MAP.get(key.lower())
+    if normalized is None:
+        return
+    if normalized == "heartbeat_ts":
+        status.heartbeat_ts = _coerce_timestamp(value)
+    else:
+        setattr(status, normalized, _coerce_float(value, field=key))
+
+
+def _add_json_feature(status: ServerStatus, feature_obj: object) -> None:
+    if not isinstance(feature_obj, dict):
+        return
+    name = str(feature_obj.get("name") or feature_obj.get("feature"))
+    if not name or name == "None":
+        return
+    status.add_feature(
+        name,
+        total=_coerce_float(feature_obj.get("total"), field="feature.total", default=0.0),
+        in_use=_coerce_float(feature_obj.get("in_use"), field="feature.in_use", default=0.0),
+        borrowed=_coerce_float(feature_obj.get("borrowed"), field="feature.borrowed", default=0.0),
+        denials=_coerce_float(feature_obj.get("denials"), field="feature.denials", default=0.0),
+    )
+
+
+# Horizontal whitespace only, so that no alternative can run across a line
+# break.
+_HSPACE = r"[^\S\r\n]"
+# Feature names; non-ASCII bytes are admitted so that UTF-8 encoded names
+# still match now that the report is scanned as bytes.
+_NAME = r"[\w.\x80-\xff-]+"
+
+# All line formats are folded into a single alternation; the order of the
+# alternatives encodes the precedence of the formats and ``lastgroup`` tells
+# which one matched. Only the keyword literals are case-insensitive, so the
+# name and digit classes that make up most of the report are matched without
+# case folding. The pattern is matched against lines with leading whitespace
+# already stripped, and no quantified class overlaps with what follows it (the
+# key class excludes ":" and "=", and values must start with a non-space), so
+# a failing line cannot backtrack quadratically.
+# Table rows are captured as a whole and tokenized with ``bytes.split`` since
+# they never contain embedded whitespace. The pattern operates on bytes; only
+# the small captured fragments are decoded.
+_TEXT_LINE_RE = re.compile(
+    r"(?:"
+    rf"(?P<heartbeat>[^\r\n]*?(?i:heartbeat){_HSPACE}*[:=]{_HSPACE}*(?P<heartbeat_value>\S[^\r\n]*))"
+    rf"|(?P<table>{_NAME}{_HSPACE}+\d+{_HSPACE}+\d+{_HSPACE}+\d+{_HSPACE}+\d+)"
+    rf"|(?P<feature>(?i:feature){_HSPACE}+(?P<feature_name>{_NAME}){_HSPACE}*:{_HSPACE}*"
+    rf"(?i:total){_HSPACE}*={_HSPACE}*(?P<feature_total>\d+){_HSPACE}+"
+    rf"(?i:in_use){_HSPACE}*={_HSPACE}*(?P<feature_in_use>\d+)"
+    rf"(?:{_HSPACE}+(?i:borrowed){_HSPACE}*={_HSPACE}*(?P<feature_borrowed>\d+))?"
+    rf"(?:{_HSPACE}+(?i:denials){_HSPACE}*={_HSPACE}*(?P<feature_denials>\d+))?)"
+    rf"|(?P<keyval>(?P<key>[\w \t\f\v/-]+)[:=]{_HSPACE}*(?P<value>\S[^\r\n]*))"
+    r")".encode("ascii")
 )
-_FEATURE_KEYVAL_RE = re.compile(
-    r"^Feature\s+(?P<name>[\w.-]+)\s*:\s*"
-    r"total\s*=\s*(?P<total>\d+)\s+"
-    r"in_use\s*=\s*(?P<in_use>\d+)"
-    r"(?:\s+borrowed\s*=\s*(?P<borrowed>\d+))?"
-    r"(?:\s+denials\s*=\s*(?P<denials>\d+))?",
-    re.IGNORECASE,
+_NAME_RE = re.compile(_NAME.encode("ascii"))
+_FEATURE_GROUPS = (
+    "feature_name",
+    "feature_total",
+    "feature_in_use",
+    "feature_borrowed",
+    "feature_denials",
 )
-_HEARTBEAT_RE = re.compile(r"heartbeat\s*[:=]\s*(?P<value>.+)$", re.IGNORECASE)
 
+_TEXT_TOTAL_KEYS = frozenset({"total licenses", "total licence", "licenses total"})
+_TEXT_IN_USE_KEYS = frozenset({"in use", "licenses in use"})
+_TEXT_AVAILABLE_KEYS = frozenset({"available", "licenses available"})
+_TEXT_DENIALS_KEYS = frozenset({"denials", "license denials"})
 
-def _parse_text_status(raw: str) -> ServerStatus:
-    status = ServerStatus()
 
-    lines = [line.strip() for line in raw.splitlines() if line.strip()]
-    for line in lines:
-        match = _HEARTBEAT_RE.search(line)
-        if match:
-            status.heartbeat_ts = _coerce_timestamp(match.group("value"))
-            continue
+def _parse_text_status(raw: Union[bytes, memoryview]) -> ServerStatus:
+    status = ServerStatus()
 
-        table_match = _FEATURE_TABLE_RE.match(line)
-        if table_match:
-            feature_status = FeatureStatus(
-                total=float(table_match.group("total")),
-                in_use=float(table_match.group("in_use")),
-                borrowed=float(table_match.group("borrowed")),
-                denials=float(table_match.group("denials")),
-            )
-            status.features[table_match.group("name")] = feature_status
+    # Well-formed table rows and "Feature NAME: key=value" rows make up most
+    # of a report; they are tokenized with split() and only the remaining
+    # lines go through the combined pattern. Consecutive table rows are
+    # collected and converted column by column once the block ends.
+    table_rows: List[List[bytes]] = []
+    for line in bytes(raw).splitlines():
+        parts = line.split()
+        if not parts:
             continue
-
-        keyval_match = _KEY_VALUE_RE.match(line)
-        if keyval_match:
-            key = keyval_match.group("key").strip().lower()
-            value = keyval_match.group("value").strip()
-            if key in {"total licenses", "total licence", "licenses total"}:
-                status.total = _coerce_float(value, field=key)
-            elif key in {"in use", "licenses in use"}:
-                status.in_use = _coerce_float(value, field=key)
-            elif key in {"available", "licenses available"}:
-                status.available = _coerce_float(value, field=key)
-            elif key in {"denials", "license denials"}:
-                status.denials = _coerce_float(value, field=key)
-            else:
-                feature_match = _FEATURE_KEYVAL_RE.match(line)
-                if feature_match:
-                    feature_status = FeatureStatus(
-                        total=float(feature_match.group("total")),
-                        in_use=float(feature_match.group("in_use")),
-                        borrowed=float(feature_match.group("borrowed") or 0.0),
-                        denials=float(feature_match.group("denials") or 0.0),
-                    )
-                    status.features[feature_match.group("name")] = feature_status
+        if (
+            len(parts) == 5
+            and parts[1].isdigit()
+            and parts[2].isdigit()
+            and parts[3].isdigit()
+            and parts[4].isdigit()
+            and _NAME_RE.fullmatch(parts[0])
+        ):
+            table_rows.append(parts)
             continue
-
-        feature_match = _FEATURE_KEYVAL_RE.match(line)
-        if feature_match:
-            feature_status = FeatureStatus(
-                total=float(feature_match.group("total")),
-                in_use=float(feature_match.group("in_use")),
-                borrowed=float(feature_match.group("borrowed") or 0.0),
-                denials=float(feature_match.group("denials") or 0.0),
-            )
-            status.features[feature_match.group("name")] = feature_status
+        if table_rows:
+            _add_table_rows(status, table_rows)
+            table_rows = []
+        if parts[0] == b"Feature" and _add_feature_row(status, parts):
             continue
+        match = _TEXT_LINE_RE.match(line.lstrip())
+        if match is not None:
+            _apply_text_match(status, match)
+    if table_rows:
+        _add_table_rows(status, table_rows)
 
     return status
 
 
+def _add_table_rows(status: ServerStatus, rows: List[List[bytes]]) -> None:
+    names, totals, in_use, borrowed, denials = zip(*rows)
+    status.add_features(
+        [_decode(name) for name in names],
+        array("d", map(float, totals)),
+        array("d", map(float, in_use)),
+        array("d", map(float, borrowed)),
+        array("d", map(float, denials)),
+    )
+
+
+_FEATURE_ROW_KEYS = (b"total", b"in_use", b"borrowed", b"denials")
+
+
+def _add_feature_row(status: ServerStatus, parts: List[bytes]) -> bool:
+    """Record a tokenized ``Feature NAME: total=N in_use=N ...`` row.
+
+    Only rows in the canonical spelling are accepted; anything else returns
+    ``False`` and is left to the combined pattern.
+    """
+    if len(parts) < 4 or not parts[1].endswith(b":"):
+        return False
+    name = parts[1][:-1]
+    # "...heartbeat:" would be picked up by the heartbeat alternative first.
+    if not _NAME_RE.fullmatch(name) or name.lower().endswith(b"heartbeat"):
+        return False
+    values = [0.0, 0.0, 0.0, 0.0]
+    index = 0
+    for token in parts[2:]:
+        key, _, value = token.partition(b"=")
+        while index < 4 and _FEATURE_ROW_KEYS[index] != key:
+            if index < 2:
+                return False
+            index += 1
+        if index == 4 or not value.isdigit():
+            return False
+        values[index] = float(value)
+        index += 1
+    if index < 2:
+        return False
+    status.add_feature(_decode(name), *values)
+    return True
+
+
+def _apply_text_match(status: ServerStatus, match: re.Match) -> None:
+    kind = match.lastgroup
+    if kind == "heartbeat":
+        status.heartbeat_ts = _coerce_timestamp(_decode(match.group("heartbeat_value")))
+    elif kind == "table":
+        name, total, in_use, borrowed, denials = match.group("table").split()
+        status.add_feature(
+            _decode(name), float(total), float(in_use), float(borrowed), float(denials)
+        )
+    elif kind == "feature":
+        name, total, in_use, borrowed, denials = match.group(*_FEATURE_GROUPS)
+        status.add_feature(
+            _decode(name),
+            float(total),
+            float(in_use),
+            float(borrowed or 0.0),
+            float(denials or 0.0),
+        )
+    else:
+        key = match.group("key").strip().lower().decode("ascii")
+        value = _decode(match.group("value")).strip()
+        if key in _TEXT_TOTAL_KEYS:
+            status.total = _coerce_float(value, field=key)
+        elif key in _TEXT_IN_USE_KEYS:
+            status.in_use = _coerce_float(value, field=key)
+        elif key in _TEXT_AVAILABLE_KEYS:
+            status.available = _coerce_float(value, field=key)
+        elif key in _TEXT_DENIALS_KEYS:
+            status.denials = _coerce_float(value, field=key)
+
+
+def _decode(value: bytes) -> str:
+    return value.decode("utf-8", errors="replace")
+
+
 def _coerce_float(value: Optional[object], *, field: str, default: float = 0.0) -> float:
     if value is None:
         return default
@@ -375,17 +753,25 @@ def _coerce_timestamp(value: Optional[object]) -> Optional[float]:
     text = str(value).strip()
     if not text:
         return None
+    return _parse_timestamp(text)
 
+
+@functools.lru_cache(maxsize=8)
+def _parse_timestamp(text: str) -> Optional[float]:
+    # The heartbeat rarely changes between polls, hence the small cache.
+    # fromisoformat() is implemented in C and already covers the common
+    # "YYYY-MM-DD HH:MM:SS" heartbeat, so it doubles as the fast path.
+    try:
+        return datetime.fromisoformat(text[:-1] if text.endswith("Z") else text).timestamp()
+    except ValueError:
+        pass
     for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%SZ"):
         try:
             return datetime.strptime(text.replace("Z", ""), fmt).timestamp()
         except ValueError:
             continue
-    try:
-        return datetime.fromisoformat(text).timestamp()
-    except ValueError:
-        _LOGGER.debug("Unable to parse heartbeat timestamp: %s", text)
-        return None
+    _LOGGER.debug("Unable to parse heartbeat timestamp: %s", text)
+    return None
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
@@ -450,7 +836,7 @@ def main(argv: Optional[List[str]] = None) -> None:
         poll_interval=args.poll_interval,
     )
     start_http_server(args.listen_port, addr=args.listen_address)
-    exporter.run()
+    exporter.start().join()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,72 @@
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "exporter"))
+
+import olicense_exporter  # noqa: E402
+from olicense_exporter import parse_status  # noqa: E402
+
+
+def test_key_without_value_is_ignored():
+    status = parse_status(b"Total licenses: 12\nTotal licenses:   \nheartbeat:  \t\n")
+
+    assert status.total == 12.0
+    assert status.heartbeat_ts is None
+
+
+def test_empty_heartbeat_keeps_previous_value():
+    status = parse_status(b"Last heartbeat: 2024-05-01 12:30:45\nheartbeat =   \n")
+
+    assert status.heartbeat_ts == olicense_exporter._coerce_timestamp("2024-05-01 12:30:45")
+
+
+def test_text_report_with_bracket_header_parses_on_every_poll(tmp_path):
+    exporter = olicense_exporter.OLicenseExporter(status_file=tmp_path / "status.txt")
+
+    for poll in range(4):
+        status = exporter._parse(b"[OLicense Server Status]\nTotal licenses: %d\n" % poll)
+        assert status.total == float(poll)
+
+
+def test_long_leading_whitespace_does_not_backtrack():
+    lines = [b" " * 100_000 + b"x", b"\t" * 100_000 + b"a", b" " * 100_000 + b"heartbeat"]
+
+    start = time.monotonic()
+    for line in lines:
+        status = olicense_exporter._parse_text_status(line)
+        assert status.total is None and not status.feature_names
+    assert time.monotonic() - start < 1.0
+
+
+def _cat_command(path):
+    return [sys.executable, "-c", "import sys; sys.stdout.buffer.write(open(sys.argv[1], 'rb').read())", str(path)]
+
+
+def test_command_output_buffer_is_reused_across_polls(tmp_path):
+    path = tmp_path / "status.txt"
+    exporter = olicense_exporter.OLicenseExporter(status_command=_cat_command(path))
+    buffer = exporter._buffer
+    size = sys.getsizeof(buffer)
+
+    for poll in range(3):
+        content = b"Total licenses: %d\n" % poll * (poll + 1)
+        path.write_bytes(content)
+        with exporter._read_status() as raw:
+            assert bytes(raw) == content
+            assert exporter._parse(raw).total == float(poll)
+        assert exporter._buffer is buffer
+        assert sys.getsizeof(buffer) == size
+
+
+def test_command_output_larger_than_buffer_grows_it(tmp_path, monkeypatch):
+    monkeypatch.setattr(olicense_exporter, "_INITIAL_BUFFER_SIZE", 16)
+    path = tmp_path / "status.txt"
+    content = b"Feature A: 10 total, 3 in use\n" * 50
+    path.write_bytes(content)
+    exporter = olicense_exporter.OLicenseExporter(status_command=_cat_command(path))
+
+    for _ in range(2):
+        with exporter._read_status() as raw:
+            assert bytes(raw) == content
+    assert len(exporter._buffer) >= len(content)